@@ -27,7 +27,7 @@ call .venv\Scripts\activate.bat
 REM Install / update dependencies
 echo Installing dependencies...
 pip install setuptools --quiet
-pip install undetected-chromedriver selenium pandas requests --quiet
+pip install undetected-chromedriver selenium requests --quiet
 if errorlevel 1 ( echo ERROR: pip install failed. & pause & exit /b 1 )
 
 echo.
@@ -4,7 +4,8 @@ VFS Global Guinea-Bissau → Portugal  ·  Unified Multi-Client Booking Bot
 =========================================================================
 Uses undetected-chromedriver (UC) to bypass Cloudflare and automates
 the full 5-step VFS booking flow for every row in clients.csv.
-Multiple clients are booked in parallel — each in its own Chrome window.
+Multiple clients are booked in parallel on a pool of Chrome windows that
+are reused from one client to the next.
 
 FIRST RUN  ── warm the session so Cloudflare cookies are saved:
     python unified_booking.py --warmup
@@ -29,21 +30,27 @@ CLIENTS CSV columns (see clients.csv):
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
 import csv
+import functools
 import glob
+import itertools
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import random
+import re
 import shutil
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
-
 try:
     import undetected_chromedriver as uc
 except ImportError:
@@ -51,15 +58,24 @@ except ImportError:
     print("       Run:  pip install undetected-chromedriver selenium")
     sys.exit(1)
 
+try:
+    import psutil   # optional: caps parallel windows by free RAM
+except ImportError:
+    psutil = None
+
+try:
+    import requests   # optional: DNS/connection warm-up before Chrome starts
+except ImportError:
+    requests = None
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     NoSuchElementException,
     TimeoutException,
-    ElementNotInteractableException,
     StaleElementReferenceException,
+    WebDriverException,
 )
 
 # ─────────────────────────────────────────────────────────────
@@ -77,15 +93,55 @@ VFS_PASSWORD = os.getenv("VFS_PASSWORD", "Bissau300@")
 CLIENTS_CSV    = Path(__file__).resolve().parent / "clients.csv"
 RESULTS_CSV    = Path(__file__).resolve().parent / "logs" / "booking_results.csv"
 SCREENSHOTS_DIR = Path(__file__).resolve().parent / "logs" / "screenshots"
-CHROME_PROFILE = os.path.expanduser("~/.vfs_chrome_profile")
+CF_COOKIE_FILE = Path(__file__).resolve().parent / "logs" / "cf_cookies.json"
 MAX_CLIENTS    = 5
+CHROME_RAM_BYTES = 400 * 1024 * 1024   # budget per Chrome window (psutil cap)
+
+
+DISK_PROFILE_BASE = os.path.expanduser("~/.vfs_chrome_profile")
+
+# VFS_TMPFS_PROFILES=1 moves the Chrome profiles onto /dev/shm (RAM), provided
+# it has TMPFS_MIN_FREE spare.  Off by default: Docker's /dev/shm is only
+# 64 MB, and a full one crashes Chrome with ENOSPC.
+TMPFS_PROFILES = os.getenv("VFS_TMPFS_PROFILES", "0") == "1"
+TMPFS_MIN_FREE = MAX_CLIENTS * 200 * 1024 * 1024
+
+
+def _profile_base() -> str:
+    """Where Chrome profiles live: tmpfs if opted in and roomy enough, so
+    cookie and IndexedDB churn from every window stays in RAM; else disk."""
+    shm = "/dev/shm"
+    if (TMPFS_PROFILES and sys.platform == "linux"
+            and os.path.isdir(shm) and os.access(shm, os.W_OK)):
+        try:
+            free = shutil.disk_usage(shm).free
+        except OSError:
+            free = 0
+        if free >= TMPFS_MIN_FREE:
+            return os.path.join(shm, "vfs_chrome_profiles")
+    return DISK_PROFILE_BASE
+
+
+CHROME_PROFILE = _profile_base()
+
+# Skip images, web fonts and trackers on every page load.  Set
+# VFS_BLOCK_RESOURCES=0 if a step ever needs something rendered as an image.
+BLOCK_RESOURCES = os.getenv("VFS_BLOCK_RESOURCES", "1") != "0"
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+]
 
 # Timeouts (seconds)
 CF_POLL_MAX    = 120   # max wait for Cloudflare challenge to clear
 ELEMENT_WAIT   = 30    # wait for a DOM element
 DROPDOWN_WAIT  = 5     # wait for mat-option list to populate
-STEP_WAIT      = 3     # pause between form steps
-PAGE_NAV_WAIT  = 6     # wait after page navigation
+STEP_WAIT      = 10    # max wait for the next form step to load and settle
+PAGE_NAV_WAIT  = 6     # max wait for the booking form after navigation
+SCRIPT_TIMEOUT = 130   # async-script ceiling; must exceed any single _wait
+POOL_ACQUIRE_WAIT = 300  # max wait for a pooled browser to launch and pass CF
+CF_SHARE_WAIT  = CF_POLL_MAX + 10  # max wait for the first window's CF cookies
 
 # ─────────────────────────────────────────────────────────────
 # SELECTORS
@@ -106,7 +162,6 @@ SEL = {
     "start_booking":  ["button[class*='new-booking' i]",
                        "button[routerlink*='book' i]",
                        "a[routerlink*='book' i]",
-                       "button:has-text('Start New Booking')",
                        "[class*='start-new-booking']"],
 
     # ── Step 1: Appointment Details (/application-detail) ────
@@ -168,45 +223,96 @@ SEL = {
 
     # ── Confirmation reference ────────────────────────────────
     "confirm_ref":    [".booking-reference", "[class*='reference']",
-                       "[class*='confirmation']", "[class*='booking-id']",
-                       "strong", "h2", "h3"],
+                       "[class*='confirmation']", "[class*='booking-id']"],
+    # Generic tags, only read once the specific selectors have had STEP_WAIT
+    "confirm_ref_fallback": ["strong", "h2", "h3"],
 }
 
+# Only present once signed in (dashboard or booking landing)
+SEL["post_login"] = ("app-dashboard", "app-home",
+                     "[class*='dashboard']",
+                     "button[class*='new-booking' i]",
+                     "a[href*='book-an-appointment']",
+                     "[routerlink*='book']")
+
+# Every entry as a tuple of fallbacks, so helpers never re-wrap strings.
+SEL = {k: (v,) if isinstance(v, str) else tuple(v) for k, v in SEL.items()}
+
+
+def _is_xpath(sel: str) -> bool:
+    return sel.startswith(("/", "("))
+
+
+# Each CSS fallback chain as one selector group, so the in-page wait can rule
+# out a miss on the whole chain in a single engine pass.  Keyed by the tuple
+# itself, so call sites keep passing SEL[...] unchanged.
+SEL_JOINED = {v: ", ".join(v) for v in SEL.values()
+              if len(v) > 1 and not any(_is_xpath(s) for s in v)}
+
+# Text-match fallback for the dashboard's "Start New Booking" button
+START_BTN_XPATHS = (
+    "//button[normalize-space()='Start New Booking']",
+    "//button[contains(text(),'Start New Booking')]",
+    "//a[contains(text(),'Start New Booking')]",
+)
+START_BTN_ANY = SEL["start_booking"] + START_BTN_XPATHS
+
+# Elements only present on a Cloudflare interstitial (not the Turnstile
+# widget, which VFS also embeds in its normal login form).
+CF_CHALLENGE_SEL = ("#cf-challenge-running, #cf-please-wait, #challenge-form, "
+                    "[id*='cf-browser-verification'], [class*='cf-browser-verification']")
+
 # ─────────────────────────────────────────────────────────────
 # LOGGING
 # ─────────────────────────────────────────────────────────────
 
+# Worker threads only enqueue records; a single listener thread does the
+# console and file writes, so log calls never block a booking on I/O.
+# QueueHandler formats each record before queueing it, so the listener's
+# handlers keep the default "%(message)s" formatter.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(
+        Path(__file__).resolve().parent / "logs" / "booking.log",
+        encoding="utf-8"
+    ),
+)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s  %(levelname)-8s %(message)s",
     datefmt="%H:%M:%S",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(
-            Path(__file__).resolve().parent / "logs" / "booking.log",
-            encoding="utf-8"
-        ),
-    ],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 log = logging.getLogger("vfs")
 
 # ─────────────────────────────────────────────────────────────
 # UTILITY HELPERS
 # ─────────────────────────────────────────────────────────────
 
+_DMY_RE = re.compile(r"^(\d{2})/(\d{2})/(\d{4})$")
+_YMD_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+@functools.lru_cache(maxsize=256)
 def _norm_date(raw: str) -> str:
     """Normalise any date to DD/MM/YYYY."""
     raw = (raw or "").strip()
     if not raw:
         return raw
-    # Already DD/MM/YYYY
-    if len(raw) == 10 and raw[2] == "/" and raw[5] == "/":
-        d, m, y = raw[:2], raw[3:5], raw[6:]
-        return raw if int(d) <= 31 and int(m) <= 12 else f"{m}/{d}/{y}"
+    # Already DD/MM/YYYY (or MM/DD/YYYY, which gets swapped)
+    m = _DMY_RE.match(raw)
+    if m:
+        d, mo, y = m.groups()
+        return raw if int(d) <= 31 and int(mo) <= 12 else f"{mo}/{d}/{y}"
     # YYYY-MM-DD
-    if len(raw) == 10 and raw[4] == "-" and raw[7] == "-":
-        y, m, d = raw[:4], raw[5:7], raw[8:]
-        return f"{d}/{m}/{y}"
+    m = _YMD_RE.match(raw)
+    if m:
+        y, mo, d = m.groups()
+        return f"{d}/{mo}/{y}"
     return raw
 
 
@@ -215,79 +321,233 @@ def _norm_code(code: str) -> str:
     return ("+" + code) if code and not code.startswith("+") else code
 
 
-def _wait(driver, selectors, timeout: float = ELEMENT_WAIT):
-    """Wait until any of the given CSS selectors is visible; return (el, sel)."""
-    if isinstance(selectors, str):
-        selectors = [selectors]
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        for sel in selectors:
-            try:
-                el = driver.find_element(By.CSS_SELECTOR, sel)
-                if el.is_displayed():
-                    return el, sel
-            except Exception:
-                pass
-        time.sleep(0.15)
-    return None, None
+# Resolves with [element, selector_index] as soon as any selector has a visible
+# match, or null after arguments[3] ms.  arguments[1][i] is true where
+# selector i is an XPath rather than CSS; arguments[2] is the optional joined
+# CSS group, used to skip the per-selector scan while nothing matches.  With
+# arguments[4] set the match is also clicked (scrolled to centre first if
+# off-screen) and a third item reports whether the click went through.  A
+# MutationObserver re-probes on every DOM change, so the whole wait is one
+# round trip instead of a Python poll loop.
+_JS_WAIT_ANY = """
+var sels = arguments[0], isXpath = arguments[1], group = arguments[2], ms = arguments[3];
+var click = arguments[4];
+var done = arguments[arguments.length - 1];
+var finished = false, mo = null, timer = null, tick = null;
+function visible(e) { return !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length); }
+function matches(sel, xpath) {
+    if (!xpath) return document.querySelectorAll(sel);
+    var r = document.evaluate(sel, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null), out = [];
+    for (var k = 0; k < r.snapshotLength; k++) out.push(r.snapshotItem(k));
+    return out;
+}
+function clickIt(el) {
+    try {
+        var r = el.getBoundingClientRect();
+        if (r.top < 0 || r.bottom > window.innerHeight) el.scrollIntoView({block:'center'});
+        el.click();
+        return true;
+    } catch (e) { return false; }
+}
+function finish(v) {
+    if (finished) return;
+    finished = true;
+    if (mo) mo.disconnect();
+    clearTimeout(timer); clearInterval(tick);
+    done(v);
+}
+function probe() {
+    if (group) {
+        var any;
+        try { any = document.querySelector(group); } catch (e) { any = true; }
+        if (!any) return;
+    }
+    for (var i = 0; i < sels.length; i++) {
+        var els;
+        try { els = matches(sels[i], isXpath[i]); } catch (e) { continue; }
+        for (var j = 0; j < els.length; j++)
+            if (visible(els[j]))
+                return finish(click ? [els[j], i, clickIt(els[j])] : [els[j], i]);
+    }
+}
+probe();
+if (!finished) {
+    mo = new MutationObserver(probe);
+    mo.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    tick = setInterval(probe, 250);   // style-only changes fire no mutation
+    timer = setTimeout(function () { finish(null); }, ms);
+}
+"""
 
 
-def _wait_xpath(driver, xpaths, timeout: float = ELEMENT_WAIT):
-    """Wait until any XPath expression matches a visible element; return (el, xpath)."""
-    if isinstance(xpaths, str):
-        xpaths = [xpaths]
+def _wait(driver, selectors, timeout: float = ELEMENT_WAIT, click: bool = False):
+    """Wait until any of the given selectors is visible; return (el, sel).
+    Selectors may mix CSS and XPath (see _is_xpath); `sel` is the first one,
+    in the order given, with a visible match.  The wait runs inside the page
+    (see _JS_WAIT_ANY) and is re-armed if the page navigates mid-wait.
+    With click=True the match is clicked in that same script."""
+    kinds = [_is_xpath(sel) for sel in selectors]
+    group = SEL_JOINED.get(tuple(selectors))
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        for xp in xpaths:
-            try:
-                el = driver.find_element(By.XPATH, xp)
-                if el.is_displayed():
-                    return el, xp
-            except Exception:
-                pass
-        time.sleep(0.15)
-    return None, None
+    while True:
+        remaining = min(deadline - time.monotonic(), SCRIPT_TIMEOUT - 5)
+        try:
+            hit = driver.execute_async_script(
+                _JS_WAIT_ANY, list(selectors), kinds, group,
+                int(max(remaining, 0) * 1000), click)
+        except TimeoutException:
+            hit = None
+        except WebDriverException:
+            # Document unloaded while waiting — try again on the new page
+            if time.monotonic() < deadline:
+                time.sleep(0.1)
+                continue
+            hit = None
+        if not hit:
+            return None, None
+        if click and not hit[2]:
+            _scroll_click(driver, hit[0])
+        return hit[0], selectors[hit[1]]
+
+
+
+# Title first: every interstitial sets one of these, so while the challenge
+# is up each poll ends without touching the DOM.  The marker probe only runs
+# once the title looks normal, to catch a challenge still mid-render.
+_JS_CF_CLEAR = """
+var t = (document.title || '').toLowerCase();
+if (/just a moment|checking your browser|attention required|ddos-guard/.test(t))
+    return false;
+return !document.querySelector(arguments[0]);
+"""
 
 
 def _wait_cf(driver) -> bool:
     """Block until Cloudflare challenge clears (or timeout)."""
     log.info("  [CF] Watching for Cloudflare challenge (max %ds)…", CF_POLL_MAX)
-    deadline = time.monotonic() + CF_POLL_MAX
-    while time.monotonic() < deadline:
-        time.sleep(0.8)
+    # Title check + targeted marker probe in one call (see _JS_CF_CLEAR).
+    # It is cheap enough to poll at 200ms, so clearance is noticed almost
+    # as soon as the redirect lands.
+    # Script errors mid-redirect are ignored and simply polled again.
+    try:
+        WebDriverWait(driver, CF_POLL_MAX, poll_frequency=0.2,
+                      ignored_exceptions=(WebDriverException,)).until(
+            lambda d: d.execute_script(_JS_CF_CLEAR, CF_CHALLENGE_SEL))
+    except TimeoutException:
+        log.warning("  [CF] Timed out — continuing anyway.")
+        return False
+    log.info("  [CF] Clear — URL: %s", _current_url(driver))
+    return True
+
+
+# Clearance cookies from the first browser past Cloudflare.  cf_clearance is
+# bound to IP + UA + TLS fingerprint, which every window launched from this
+# process shares, so the other browsers can reuse it instead of re-solving.
+CF_COOKIE_NAMES = ("cf_clearance", "__cf_bm")
+_CF_COOKIE_CACHE: dict = {}
+_CF_COOKIE_LOCK = threading.Lock()
+# Set once the first window has cleared CF (or given up); the other windows
+# hold off their first navigation until then so they can be seeded.
+_CF_COOKIE_READY = threading.Event()
+_CF_LEADER_CLAIMED = False
+
+
+def _load_cf_cookies() -> dict:
+    """Unexpired CF cookies saved by the previous run (see _save_cf_cookies).
+    The tmpfs profiles do not survive a reboot; this file does."""
+    try:
+        saved = json.loads(CF_COOKIE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {c["name"]: c for c in saved
+            if c.get("name") in CF_COOKIE_NAMES and c.get("expiry", now + 1) > now}
+
+
+# Only used to seed browsers until one of them clears Cloudflare this run
+_CF_COOKIE_STORED = _load_cf_cookies()
+
+
+def _save_cf_cookies() -> None:
+    """Persist this run's CF cookies for the next one."""
+    with _CF_COOKIE_LOCK:
+        cookies = list(_CF_COOKIE_CACHE.values())
+    if not cookies:
+        return
+    try:
+        CF_COOKIE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CF_COOKIE_FILE.write_text(json.dumps(cookies), encoding="utf-8")
+    except OSError as e:
+        log.warning("  [CF] Could not save cookies: %s", e)
+
+
+def _cache_cf_cookies(driver) -> None:
+    """Remember this browser's CF cookies if no other browser has yet."""
+    with _CF_COOKIE_LOCK:
+        if _CF_COOKIE_CACHE:
+            return
         try:
-            title = (driver.title or "").lower()
-            src   = driver.page_source.lower()
-            if ("just a moment" not in title
-                    and "checking your browser" not in title
-                    and "ddos-guard" not in src
-                    and "cf-browser-verification" not in src):
-                log.info("  [CF] Clear — URL: %s", driver.current_url)
-                return True
+            cookies = driver.get_cookies()
         except Exception:
-            pass
-    log.warning("  [CF] Timed out — continuing anyway.")
+            return
+        for c in cookies:
+            if c.get("name") in CF_COOKIE_NAMES:
+                _CF_COOKIE_CACHE[c["name"]] = c
+        if _CF_COOKIE_CACHE:
+            log.info("  [CF] Cached %s for the other windows.", ", ".join(_CF_COOKIE_CACHE))
+            _CF_COOKIE_READY.set()
+
+
+def _claim_cf_leader() -> bool:
+    """True for the first caller, which solves CF for everyone.  Every later
+    caller waits up to CF_SHARE_WAIT for its cookies, then returns False and
+    navigates anyway (seeded if the first window got through)."""
+    global _CF_LEADER_CLAIMED
+    with _CF_COOKIE_LOCK:
+        if not _CF_LEADER_CLAIMED:
+            _CF_LEADER_CLAIMED = True
+            return True
+    if not _CF_COOKIE_READY.is_set():
+        log.info("  [CF] Waiting for the first window to clear Cloudflare…")
+        if not _CF_COOKIE_READY.wait(CF_SHARE_WAIT):
+            log.warning("  [CF] No shared cookies after %ds — solving in this window.",
+                        CF_SHARE_WAIT)
     return False
 
 
-def _js_fill(driver, selector, value: str, label: str = "") -> bool:
-    """Fill an Angular <input> via JS native setter so reactive forms pick it up."""
-    if not value:
+def _seed_cf_cookies(driver) -> bool:
+    """Inject cached CF cookies before the first navigation.  Uses CDP
+    Network.setCookies, which (unlike add_cookie) needs no page on the domain."""
+    with _CF_COOKIE_LOCK:
+        cookies = list((_CF_COOKIE_CACHE or _CF_COOKIE_STORED).values())
+    if not cookies:
         return False
-    if isinstance(selector, list):
-        sels = selector
-    else:
-        sels = [selector]
-
-    el, matched = _wait(driver, sels)
-    if not el:
-        log.warning("  [warn] field not found: %s", label or sels)
+    params = []
+    for c in cookies:
+        p = {"name": c["name"], "value": c["value"], "domain": c["domain"],
+             "path": c.get("path", "/"), "secure": c.get("secure", False),
+             "httpOnly": c.get("httpOnly", False)}
+        if "expiry" in c:
+            p["expires"] = c["expiry"]
+        if c.get("sameSite") in ("Strict", "Lax", "None"):
+            p["sameSite"] = c["sameSite"]
+        params.append(p)
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        return True
+    except Exception as e:
+        log.warning("  [CF] Could not seed cached cookies: %s", e)
         return False
+
+
+def _js_set_value(driver, el, value: str) -> bool:
+    """Set an <input>'s value via the native setter and fire input/change/blur
+    so Angular reactive forms pick it up — a single round trip per field."""
     try:
-        ok = driver.execute_script(
+        return bool(driver.execute_script(
             """
-            var s = arguments[0], val = arguments[1];
-            var el = document.querySelector(s);
+            var el = arguments[0], val = arguments[1];
             if (!el) return false;
             var setter = Object.getOwnPropertyDescriptor(
                 window.HTMLInputElement.prototype,'value').set;
@@ -297,22 +557,46 @@ def _js_fill(driver, selector, value: str, label: str = "") -> bool:
             });
             return true;
             """,
-            matched if matched else sels[0],
-            str(value),
-        )
-        if ok:
-            log.info("  [fill] %-25s = %s", label or matched, value)
-            return True
+            el, str(value),
+        ))
+    except Exception:
+        return False
+
+
+# Fired once after a send_keys fallback, so Angular sees the final value
+_JS_FIRE_EVENTS = """
+var el = arguments[0];
+['input','change','blur'].forEach(function(e){
+    el.dispatchEvent(new Event(e,{bubbles:true}));
+});
+"""
+
+
+def _fire_events(driver, el) -> None:
+    try:
+        driver.execute_script(_JS_FIRE_EVENTS, el)
     except Exception:
         pass
-    # fallback: clear then send_keys char by char
+
+
+def _js_fill(driver, sels, value: str, label: str = "") -> bool:
+    """Fill an Angular <input> via JS native setter so reactive forms pick it up."""
+    if not value:
+        return False
+    el, matched = _wait(driver, sels)
+    if not el:
+        log.warning("  [warn] field not found: %s", label or sels)
+        return False
+    if _js_set_value(driver, el, value):
+        log.info("  [fill] %-25s = %s", label or matched, value)
+        return True
+    # fallback: clear, type the whole value in one send_keys, then notify
     try:
         driver.execute_script("arguments[0].value = '';", el)
         el.send_keys(Keys.CONTROL + "a")
         el.send_keys(Keys.DELETE)
-        for ch in str(value):
-            el.send_keys(ch)
-            time.sleep(random.uniform(0.03, 0.09))
+        el.send_keys(str(value))
+        _fire_events(driver, el)
         log.info("  [fill-sk] %-22s = %s", label or matched, value)
         return True
     except Exception as e:
@@ -320,41 +604,58 @@ def _js_fill(driver, selector, value: str, label: str = "") -> bool:
         return False
 
 
+def _js_fill_batch(driver, fields: dict) -> list:
+    """Fill several Angular <input>s in one execute_script round trip.
+    `fields` maps label -> (selectors, value); each field takes the first
+    selector that exists.  Returns the labels that could not be filled."""
+    payload = [[label, list(sels), str(value)]
+               for label, (sels, value) in fields.items() if value]
+    if not payload:
+        return []
+    try:
+        missed = driver.execute_script(
+            """
+            var setter = Object.getOwnPropertyDescriptor(
+                window.HTMLInputElement.prototype,'value').set;
+            var misses = [];
+            arguments[0].forEach(function(f){
+                var el = null;
+                for (var i = 0; i < f[1].length && !el; i++)
+                    el = document.querySelector(f[1][i]);
+                if (!el) { misses.push(f[0]); return; }
+                setter.call(el, f[2]);
+                ['input','change','blur'].forEach(function(e){
+                    el.dispatchEvent(new Event(e,{bubbles:true}));
+                });
+            });
+            return misses;
+            """,
+            payload,
+        )
+    except Exception:
+        return [f[0] for f in payload]
+    for label, _, value in payload:
+        if label not in missed:
+            log.info("  [fill] %-25s = %s", label, value)
+    return list(missed or [])
+
+
 def _fill_date(driver, selectors, value: str, label: str = "") -> bool:
     """Fill a date picker input. Tries JS native setter first, then direct key entry.
     VFS date pickers accept DD/MM/YYYY typed directly into the input."""
     if not value:
         return False
-    if isinstance(selectors, str):
-        selectors = [selectors]
     el, matched = _wait(driver, selectors)
     if not el:
         log.warning("  [warn] date field not found: %s", label)
         return False
-    try:
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        # Try JS setter first
-        ok = driver.execute_script(
-            """
-            var el = arguments[0], val = arguments[1];
-            var setter = Object.getOwnPropertyDescriptor(
-                window.HTMLInputElement.prototype,'value').set;
-            setter.call(el, val);
-            ['input','change','blur'].forEach(function(e){
-                el.dispatchEvent(new Event(e,{bubbles:true}));
-            });
-            return true;
-            """,
-            el, str(value),
-        )
-        if ok:
-            log.info("  [date] %-25s = %s", label, value)
-            return True
-    except Exception:
-        pass
+    # Try JS setter first (needs no scrolling)
+    if _js_set_value(driver, el, value):
+        log.info("  [date] %-25s = %s", label, value)
+        return True
     # Fallback: click field, select-all, type
     try:
-        el.click()
+        _scroll_click(driver, el)
         time.sleep(0.2)
         el.send_keys(Keys.CONTROL + "a")
         el.send_keys(Keys.DELETE)
@@ -371,8 +672,6 @@ def _native_select(driver, selectors, text: str, label: str = "") -> bool:
     """Handle a plain HTML <select> element by matching visible option text."""
     if not text:
         return False
-    if isinstance(selectors, str):
-        selectors = [selectors]
     el, _ = _wait(driver, selectors, timeout=5)
     if not el:
         return False
@@ -397,13 +696,11 @@ def _mat_select(driver, selectors, text: str, label: str = "") -> bool:
     Falls back to native <select> if mat-select is not found."""
     if not text:
         return False
-    if isinstance(selectors, str):
-        selectors = [selectors]
 
     el, sel_used = _wait(driver, selectors)
     if not el:
         # Try native <select> fallback — swap mat-select prefix for plain select
-        native_sels = [s.replace("mat-select", "select") for s in selectors]
+        native_sels = tuple(s.replace("mat-select", "select") for s in selectors)
         if _native_select(driver, native_sels, text, label):
             return True
         log.warning("  [warn] mat-select not found: %s  (%s)", label, selectors)
@@ -412,9 +709,11 @@ def _mat_select(driver, selectors, text: str, label: str = "") -> bool:
         # If element is a plain <select>, delegate immediately
         tag = el.tag_name.lower()
         if tag == "select":
-            return _native_select(driver, [sel_used], text, label)
+            return _native_select(driver, (sel_used,), text, label)
 
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
+        # Native click: Material binds the toggle to the inner
+        # .mat-select-trigger, which a synthetic el.click() on the host never
+        # reaches.  WebDriver scrolls into view and clicks the centre.
         el.click()
         # Wait for overlay panel to populate
         options = []
@@ -457,26 +756,85 @@ def _mat_select(driver, selectors, text: str, label: str = "") -> bool:
         return False
 
 
+# The selector that matched last time for a fallback chain, shared across
+# windows, so later waits test the known-good one before the rest.
+SELECTOR_HINTS: dict[str, str] = {}
+_HINTS_LOCK = threading.Lock()
+
+
+def _hinted(key: str, selectors: tuple) -> tuple:
+    """`selectors` with the remembered winner for `key` (if any) moved first."""
+    hint = SELECTOR_HINTS.get(key)
+    if hint is None or hint not in selectors:
+        return selectors
+    return (hint,) + tuple(sel for sel in selectors if sel != hint)
+
+
+def _remember(key: str, matched: str | None) -> None:
+    if matched:
+        with _HINTS_LOCK:
+            SELECTOR_HINTS[key] = matched
+
+
+def _scroll_click(driver, el) -> None:
+    """Click `el` in one round trip, scrolling it to centre only if it is off-screen."""
+    driver.execute_script(
+        """
+        var el = arguments[0], r = el.getBoundingClientRect();
+        if (r.top < 0 || r.bottom > window.innerHeight)
+            el.scrollIntoView({block:'center'});
+        el.click();
+        """,
+        el,
+    )
+
+
 def _click(driver, selectors, label: str = "") -> bool:
-    if isinstance(selectors, str):
-        selectors = [selectors]
-    el, _ = _wait(driver, selectors, timeout=10)
+    """Find and click the first visible match in a single script call."""
+    try:
+        el, _ = _wait(driver, selectors, timeout=10, click=True)
+    except Exception as e:
+        log.error("  [error] click %s: %s", label, e)
+        return False
     if not el:
         log.warning("  [warn] button not found: %s", label)
         return False
+    log.info("  [click] %s", label)
+    return True
+
+
+# Resolves true once the document is loaded, no loading indicator is visible
+# and (if arguments[1] is set) the URL has moved on from it; false at timeout.
+_JS_SETTLED = """
+var deadline = Date.now() + arguments[0] * 1000, leave = arguments[1];
+var done = arguments[arguments.length - 1];
+var busySel = 'mat-progress-spinner, mat-spinner, mat-progress-bar, .loading, .spinner';
+function visible(e) { return !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length); }
+(function check() {
+    var busy = Array.prototype.some.call(document.querySelectorAll(busySel), visible);
+    if (!busy && document.readyState === 'complete' && (!leave || location.href !== leave))
+        return done(true);
+    if (Date.now() > deadline) return done(false);
+    setTimeout(check, 100);
+})();
+"""
+
+
+def _wait_settled(driver, timeout: float = 5, leave_url: str = "") -> bool:
+    """Wait (in-page) until Angular has finished loading instead of sleeping
+    a fixed time.  Pass `leave_url` after a Continue click to also wait for
+    the route change."""
     try:
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        try:
-            el.click()
-        except ElementNotInteractableException:
-            driver.execute_script("arguments[0].click();", el)
-        log.info("  [click] %s", label)
-        return True
-    except Exception as e:
-        log.error("  [error] click %s: %s", label, e)
+        return bool(driver.execute_async_script(_JS_SETTLED, timeout, leave_url))
+    except Exception:
         return False
 
 
+def _timestamp() -> str:
+    """Local time as ISO-8601 to the second, for result rows."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
 def _current_url(driver) -> str:
     try:
         return driver.current_url or ""
@@ -487,7 +845,7 @@ def _current_url(driver) -> str:
 def _screenshot(driver, slug: str) -> None:
     try:
         SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now().strftime("%H%M%S")
+        ts = time.strftime("%H%M%S")
         path = SCREENSHOTS_DIR / f"{ts}_{slug}.png"
         driver.save_screenshot(str(path))
         log.info("  [screenshot] %s", path.name)
@@ -500,12 +858,35 @@ def _screenshot(driver, slug: str) -> None:
 # ─────────────────────────────────────────────────────────────
 
 def do_login(driver) -> bool:
-    """Navigate to login page and submit credentials."""
-    log.info("[Login] Loading login page…")
-    driver.get(VFS_LOGIN_URL)
-    _wait_cf(driver)
-
-    email_el, _ = _wait(driver, SEL["login_email"])
+    """Navigate to login page and submit credentials.  Pooled windows are
+    normally signed in already (see BrowserPool), and one reused from an
+    earlier client may still be; either is detected without logging in again."""
+    url = _current_url(driver)
+    if url.startswith(VFS_BASE) and "/login" not in url:
+        post, _ = _wait(driver, SEL["post_login"], timeout=2)
+        if post:
+            log.info("[Login] Session still signed in.")
+            return True
+    if not url.startswith(VFS_LOGIN_URL):
+        leader = _claim_cf_leader()
+        log.info("[Login] Loading login page…")
+        try:
+            if _seed_cf_cookies(driver):
+                log.info("  [CF] Seeded cached clearance cookies.")
+            driver.get(VFS_LOGIN_URL)
+            if _wait_cf(driver):
+                _cache_cf_cookies(driver)
+        finally:
+            if leader:
+                # Release the waiting windows even if this one never cleared
+                _CF_COOKIE_READY.set()
+
+    email_el, matched = _wait(driver, SEL["login_email"] + SEL["post_login"])
+    if matched in SEL["post_login"]:
+        if "/login" not in _current_url(driver):
+            log.info("[Login] Session still signed in.")
+            return True
+        email_el, _ = _wait(driver, SEL["login_email"])
     pwd_el, _   = _wait(driver, SEL["login_password"])
 
     if not email_el or not pwd_el:
@@ -513,34 +894,22 @@ def do_login(driver) -> bool:
         _screenshot(driver, "login_fail")
         return False
 
-    try:
-        email_el.clear()
-    except Exception:
-        pass
-    for ch in VFS_USERNAME:
-        email_el.send_keys(ch)
-        time.sleep(random.uniform(0.03, 0.09))
-    time.sleep(0.3)
-
-    try:
-        pwd_el.clear()
-    except Exception:
-        pass
-    for ch in VFS_PASSWORD:
-        pwd_el.send_keys(ch)
-        time.sleep(random.uniform(0.03, 0.09))
-    time.sleep(0.3)
+    # One native-setter call per field; CF fingerprints the browser, not the
+    # typing cadence, so per-character send_keys only cost round trips.
+    for el, value in ((email_el, VFS_USERNAME), (pwd_el, VFS_PASSWORD)):
+        if not _js_set_value(driver, el, value):
+            try:
+                el.clear()
+            except Exception:
+                pass
+            el.send_keys(value)
+            _fire_events(driver, el)
+        time.sleep(random.uniform(0.2, 0.5))
 
     _click(driver, SEL["login_button"], "login submit")
 
     # Wait for dashboard or booking landing
-    post, _ = _wait(driver, [
-        "app-dashboard", "app-home",
-        "[class*='dashboard']",
-        "button[class*='new-booking' i]",
-        "a[href*='book-an-appointment']",
-        "[routerlink*='book']",
-    ], timeout=15)
+    post, _ = _wait(driver, SEL["post_login"], timeout=15)
 
     if post:
         log.info("[Login] Logged in successfully.")
@@ -581,26 +950,27 @@ def do_step1_appointment_details(driver, client: dict) -> bool:
     else:
         _mat_select(driver, SEL["app_centre"],
                     client.get("application_center", ""), "Application Centre")
-    time.sleep(0.5)
+    _wait_settled(driver)
 
     _mat_select(driver, SEL["appt_category"],
                 client.get("visa_type", ""), "Appointment Category")
-    time.sleep(0.5)
+    _wait_settled(driver)
 
     _mat_select(driver, SEL["appt_subcategory"],
                 client.get("service_center", ""), "Sub-category")
-    time.sleep(0.5)
+    _wait_settled(driver)
 
     if client.get("trip_reason"):
         el, _ = _wait(driver, SEL["trip_reason"], timeout=3)
         if el:
             _mat_select(driver, SEL["trip_reason"],
                         client.get("trip_reason", ""), "Purpose of Travel")
-            time.sleep(0.3)
+            _wait_settled(driver)
 
     _screenshot(driver, "step1_filled")
+    url = _current_url(driver)
     clicked = _click(driver, SEL["step1_continue"], "Continue (Step 1)")
-    time.sleep(STEP_WAIT)
+    _wait_settled(driver, STEP_WAIT, leave_url=url if clicked else "")
     return clicked
 
 
@@ -622,23 +992,32 @@ def do_step2_your_details(driver, client: dict) -> bool:
     expiry = _norm_date(client.get("passport_expiry", ""))
     cc     = _norm_code(client.get("mobile_country_code", ""))
 
-    _js_fill(driver, SEL["first_name"],         client.get("first_name", ""),    "First Name")
-    _js_fill(driver, SEL["last_name"],           client.get("last_name", ""),     "Last Name")
-    _fill_date(driver, SEL["date_of_birth"],     dob,                             "Date of Birth")
-    _js_fill(driver, SEL["passport_number"],     client.get("passport_number", ""), "Passport Number")
-    _fill_date(driver, SEL["passport_expiry"],   expiry,                          "Passport Expiry")
-    _js_fill(driver, SEL["mobile_country_code"], cc,                              "Country Code")
-    _js_fill(driver, SEL["mobile_number"],       client.get("mobile_number", ""), "Mobile Number")
+    # All text/date inputs go in one script; only misses take the slow
+    # per-field path (which waits for the element and can fall back to keys).
+    fields = {
+        "First Name":      (SEL["first_name"],          client.get("first_name", "")),
+        "Last Name":       (SEL["last_name"],           client.get("last_name", "")),
+        "Date of Birth":   (SEL["date_of_birth"],       dob),
+        "Passport Number": (SEL["passport_number"],     client.get("passport_number", "")),
+        "Passport Expiry": (SEL["passport_expiry"],     expiry),
+        "Country Code":    (SEL["mobile_country_code"], cc),
+        "Mobile Number":   (SEL["mobile_number"],       client.get("mobile_number", "")),
+    }
+    for label in _js_fill_batch(driver, fields):
+        sels, value = fields[label]
+        fill = _fill_date if label in ("Date of Birth", "Passport Expiry") else _js_fill
+        fill(driver, sels, value, label)
 
     _mat_select(driver, SEL["gender"],
                 client.get("gender", ""), "Gender")
     _mat_select(driver, SEL["current_nationality"],
                 client.get("current_nationality", ""), "Nationality")
 
-    time.sleep(0.5)
+    _wait_settled(driver)
     _screenshot(driver, "step2_filled")
+    url = _current_url(driver)
     clicked = _click(driver, SEL["step2_continue"], "Continue (Step 2)")
-    time.sleep(STEP_WAIT)
+    _wait_settled(driver, STEP_WAIT, leave_url=url if clicked else "")
     return clicked
 
 
@@ -651,28 +1030,29 @@ def do_step3_book_appointment(driver) -> bool:
     slot_el, _ = _wait(driver, SEL["first_slot"], timeout=15)
     if slot_el:
         try:
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", slot_el)
-            slot_el.click()
+            _scroll_click(driver, slot_el)
             log.info("  [Step 3] Slot selected.")
-            time.sleep(1)
+            _wait_settled(driver)
         except Exception as e:
             log.warning("  [Step 3] Could not click slot: %s", e)
     else:
         log.warning("  [Step 3] No available slot element found — form may handle selection differently.")
 
     _screenshot(driver, "step3")
+    url = _current_url(driver)
     clicked = _click(driver, SEL["step3_continue"], "Continue (Step 3)")
-    time.sleep(STEP_WAIT)
+    _wait_settled(driver, STEP_WAIT, leave_url=url if clicked else "")
     return clicked
 
 
 def do_step4_services(driver) -> bool:
     """Step 4 — /services: accept defaults and continue."""
     log.info("  [Step 4] Services…")
-    time.sleep(2)
+    _wait_settled(driver)
     _screenshot(driver, "step4")
+    url = _current_url(driver)
     clicked = _click(driver, SEL["step4_continue"], "Continue (Step 4)")
-    time.sleep(STEP_WAIT)
+    _wait_settled(driver, STEP_WAIT, leave_url=url if clicked else "")
     return clicked
 
 
@@ -682,23 +1062,36 @@ def do_step5_review_confirm(driver) -> Optional[str]:
     Returns the booking reference string, or None.
     """
     log.info("  [Step 5] Review & Confirm…")
-    time.sleep(2)
+    _wait_settled(driver)
     _screenshot(driver, "step5_review")
 
-    _click(driver, SEL["confirm_button"], "Confirm Booking")
-    time.sleep(4)
+    url = _current_url(driver)
+    if _click(driver, SEL["confirm_button"], "Confirm Booking"):
+        _wait_settled(driver, STEP_WAIT, leave_url=url)
+        # The route can change before the reference renders; wait for it
+        # specifically so a heading on the new page isn't taken for it.
+        _wait(driver, SEL["confirm_ref"], timeout=STEP_WAIT)
 
     _screenshot(driver, "step5_confirmed")
 
-    for sel in SEL["confirm_ref"]:
-        try:
-            el = driver.find_element(By.CSS_SELECTOR, sel)
-            text = (el.get_attribute("innerText") or "").strip()
-            if text:
-                log.info("  [Ref] %s", text)
-                return text
-        except Exception:
-            continue
+    # Test every candidate in the page and return the first non-empty text
+    try:
+        text = driver.execute_script(
+            """
+            var sels = arguments[0];
+            for (var i = 0; i < sels.length; i++) {
+                var e = document.querySelector(sels[i]);
+                if (e) { var t = (e.innerText || '').trim(); if (t) return t; }
+            }
+            return null;
+            """,
+            list(SEL["confirm_ref"] + SEL["confirm_ref_fallback"]),
+        )
+    except Exception:
+        text = None
+    if text:
+        log.info("  [Ref] %s", text)
+        return text
     return None
 
 
@@ -710,11 +1103,18 @@ def do_step5_review_confirm(driver) -> Optional[str]:
 # BROWSER LAUNCH
 # ─────────────────────────────────────────────────────────────
 
+_CHROME_CANDIDATES = (
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _find_chrome() -> str | None:
+    """Locate the Chrome binary once per process; every launch reuses it."""
     candidates = [
-        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-        os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
+        *_CHROME_CANDIDATES,
         *glob.glob(os.path.expanduser("~/.cache/selenium/chrome/linux64/*/chrome")),
     ]
     for p in candidates:
@@ -726,9 +1126,34 @@ def _find_chrome() -> str | None:
             or shutil.which("chromium-browser"))
 
 
+_PATCHER_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _patch_chromedriver() -> str | None:
+    try:
+        patcher = uc.Patcher()
+        patcher.auto()
+        return patcher.executable_path
+    except Exception as e:
+        log.warning("[Browser] Could not pre-patch chromedriver: %s", e)
+        return None
+
+
+def _patched_chromedriver() -> str | None:
+    """Download and patch chromedriver once per process.  Left to itself every
+    uc.Chrome deletes, re-downloads and re-patches the same binary, racing the
+    windows launching alongside it; given this path it only checks the patch."""
+    with _PATCHER_LOCK:
+        return _patch_chromedriver()
+
+
 def launch_driver(headless: bool = False, proxy: str = "", profile_dir: str = "") -> uc.Chrome:
     """Launch an undetected-chromedriver Chrome instance."""
     options = uc.ChromeOptions()
+    # driver.get returns at DOMContentLoaded instead of the load event; every
+    # step waits for its own elements in-page, so nothing needs the full load.
+    options.page_load_strategy = "eager"
     options.add_argument("--window-size=1366,768")
     options.add_argument("--lang=en-US,en;q=0.9")
     options.add_argument("--no-first-run")
@@ -738,10 +1163,26 @@ def launch_driver(headless: bool = False, proxy: str = "", profile_dir: str = ""
     options.add_argument("--disable-infobars")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    # Trim work no booking needs, so more windows fit on one VPS
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-features=Translate,MediaRouter")
+    prefs = {"profile.default_content_setting_values.notifications": 2}
+    if BLOCK_RESOURCES:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs["profile.managed_default_content_settings.images"] = 2
+    options.add_experimental_option("prefs", prefs)
 
     if profile_dir:
         os.makedirs(profile_dir, exist_ok=True)
         options.add_argument(f"--user-data-dir={profile_dir}")
+        # The HTTP cache always goes to real disk, even when the profile is on
+        # tmpfs, so VFS's JS/CSS bundles survive a reboot and don't eat RAM.
+        cache_dir = os.path.join(DISK_PROFILE_BASE, "cache",
+                                 os.path.basename(os.path.normpath(profile_dir)))
+        options.add_argument(f"--disk-cache-dir={cache_dir}")
+        options.add_argument("--disk-cache-size=268435456")
 
     if proxy:
         options.add_argument(f"--proxy-server={proxy}")
@@ -754,23 +1195,177 @@ def launch_driver(headless: bool = False, proxy: str = "", profile_dir: str = ""
         headless=headless,
         use_subprocess=True,
         browser_executable_path=chrome_bin if chrome_bin else None,
+        driver_executable_path=_patched_chromedriver(),
     )
     driver.set_page_load_timeout(60)
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
     driver.implicitly_wait(0)
+    if BLOCK_RESOURCES:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            log.warning("[Browser] Could not set blocked URLs: %s", e)
     log.info("[Browser] undetected-chromedriver started (headless=%s)", headless)
     return driver
 
 
+# Each window runs on a persistent profile slot (slot_1 … slot_N) that keeps
+# its cookies and disk cache between runs.  Chrome won't share a
+# user-data-dir between processes, so a slot is locked while a window is up.
+_SLOT_LOCKS: dict = {}
+_SLOT_LOCKS_GUARD = threading.Lock()
+
+
+def _slot_profile(slot: int) -> str:
+    return os.path.join(CHROME_PROFILE, f"slot_{slot}")
+
+
+def _slot_lock(slot: int) -> threading.Lock:
+    with _SLOT_LOCKS_GUARD:
+        return _SLOT_LOCKS.setdefault(slot, threading.Lock())
+
+
+def _claim_slot(preferred: int) -> int:
+    """Lock `preferred` if it is free, else the lowest free slot."""
+    for slot in itertools.chain((preferred,), itertools.count(1)):
+        if _slot_lock(slot).acquire(blocking=False):
+            return slot
+
+
+def launch_slot_driver(slot: int, headless: bool = False, proxy: str = ""):
+    """
+    Launch Chrome on profile slot `slot`, or the lowest free one if another
+    window holds it.  Returns (driver, slot); driver is None if the launch
+    failed.  The slot stays claimed until quit_slot_driver.
+    """
+    slot = _claim_slot(slot)
+    try:
+        return launch_driver(headless=headless, proxy=proxy,
+                             profile_dir=_slot_profile(slot)), slot
+    except Exception as exc:
+        _slot_lock(slot).release()
+        log.warning("[Slot %d] Launch failed: %s", slot, exc)
+        return None, slot
+
+
+def quit_slot_driver(driver, slot: int) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    finally:
+        _slot_lock(slot).release()
+
+
+def warm_slot(slot: int, proxy: str = "") -> None:
+    """Log in once on `slot` so its profile holds a session and warm cache."""
+    driver, slot = launch_slot_driver(slot, proxy=proxy)
+    if driver is None:
+        return
+    try:
+        do_login(driver)
+    except Exception as exc:
+        log.warning("[Slot %d] Warm-up failed: %s", slot, exc)
+    finally:
+        quit_slot_driver(driver, slot)
+
+
+class BrowserPool:
+    """
+    Chrome windows launched up front, past Cloudflare and signed in before
+    any client needs them.  Clients borrow one through driver() instead of
+    cold-starting their own, and it goes back to the pool after.
+    A slot whose launch failed is handed out as None, so book_client falls
+    back to launching its own window.
+    """
+
+    def __init__(self, size: int, headless: bool = False, proxy: str = ""):
+        self.size = size
+        self.headless = headless
+        self.proxy = proxy
+        self._idle: queue.Queue = queue.Queue()
+        self._slots: dict = {}      # driver -> profile slot it holds
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> "BrowserPool":
+        """Warm every slot in the background.  Each one becomes available as
+        soon as it is ready, so early clients don't wait for the slowest."""
+        for slot in range(1, self.size + 1):
+            threading.Thread(target=self._fill_slot, args=(slot,),
+                             name=f"pool-{slot}", daemon=True).start()
+        return self
+
+    def _fill_slot(self, slot: int) -> None:
+        driver, slot = launch_slot_driver(slot, self.headless, self.proxy)
+        if driver is not None:
+            with self._lock:
+                if self._closed:
+                    quit_slot_driver(driver, slot)
+                    return
+                self._slots[driver] = slot
+            # Launches overlap here; the first slot to reach the login page
+            # solves CF and the rest wait to be seeded with its cookies (see
+            # _claim_cf_leader).  A failed login leaves the window on the
+            # login page for book_client to retry.
+            try:
+                do_login(driver)
+            except Exception as exc:
+                log.warning("[Pool] Slot %d warm-up failed: %s", slot, exc)
+        self._idle.put(driver)
+
+    def acquire(self, timeout: float | None = None):
+        """Borrow a driver (None for a failed slot); raises queue.Empty on timeout."""
+        return self._idle.get(timeout=timeout)
+
+    def release(self, driver) -> None:
+        """Hand a driver back, replacing it with None if the window has died."""
+        if driver is not None:
+            try:
+                driver.current_url
+            except Exception:
+                with self._lock:
+                    slot = self._slots.pop(driver, None)
+                if slot is not None:
+                    quit_slot_driver(driver, slot)
+                driver = None
+        self._idle.put(driver)
+
+    @contextlib.contextmanager
+    def driver(self, timeout: float | None = None):
+        try:
+            driver = self.acquire(timeout)
+        except queue.Empty:
+            log.warning("[Pool] No browser ready after %ss — launching a fresh one.", timeout)
+            yield None
+            return
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            slots, self._slots = self._slots, {}
+        for driver, slot in slots.items():
+            quit_slot_driver(driver, slot)
+
+
 # ─────────────────────────────────────────────────────────────
-# PER-CLIENT BOOKING  (runs in its own thread + browser)
+# PER-CLIENT BOOKING  (own thread, pooled browser window)
 # ─────────────────────────────────────────────────────────────
 
 def book_client(client: dict, idx: int, total: int,
-                headless: bool = False, proxy: str = "") -> dict:
+                headless: bool = False, proxy: str = "",
+                driver=None) -> dict:
     """
-    Launch a dedicated Chrome window, log in, and complete the full 5-step form.
-    Each client runs in its own thread with its own browser instance so all
-    bookings happen in parallel without interfering with each other.
+    Log in and complete the full 5-step form for one client.
+    Each client runs in its own thread; in parallel mode the window is
+    borrowed from the BrowserPool and handed to the next client afterwards.
+    Pass a pre-launched `driver` to skip the launch; the caller keeps
+    ownership of it.  Without one a fresh window is launched and quit.
     Returns a result dict.
     """
     name = f"{client.get('first_name','')  } {client.get('last_name','')}".strip()
@@ -784,14 +1379,16 @@ def book_client(client: dict, idx: int, total: int,
         "status": "FAILED",
         "reference": "",
         "error": "",
-        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "timestamp": _timestamp(),
     }
 
-    # Each client gets an isolated Chrome profile so sessions don't collide
-    profile = os.path.join(CHROME_PROFILE, f"client_{idx}")
-    driver = None
+    own_driver = driver is None
     try:
-        driver = launch_driver(headless=headless, proxy=proxy, profile_dir=profile)
+        if own_driver:
+            driver, slot = launch_slot_driver(idx, headless, proxy)
+            if driver is None:
+                result["error"] = "Browser launch failed"
+                return result
 
         # ── Login ────────────────────────────────────────────
         logged_in = do_login(driver)
@@ -800,30 +1397,26 @@ def book_client(client: dict, idx: int, total: int,
             return result
 
         # ── Navigate to booking form ─────────────────────────
-        time.sleep(1.5)
         start_url = _current_url(driver)
         log.info("  [nav] Dashboard URL: %s", start_url)
 
-        # Try CSS selectors, then XPath text-match for the button
-        start_btn, _ = _wait(driver, SEL["start_booking"], timeout=6)
-        if not start_btn:
-            start_btn, _ = _wait_xpath(driver, [
-                "//button[normalize-space()='Start New Booking']",
-                "//button[contains(text(),'Start New Booking')]",
-                "//a[contains(text(),'Start New Booking')]",
-            ], timeout=6)
+        # CSS selectors first, then the XPath text-match, in one wait
+        try:
+            start_btn, matched = _wait(driver, _hinted("start_booking", START_BTN_ANY),
+                                       timeout=8, click=True)
+        except Exception:
+            start_btn = matched = None
+        _remember("start_booking", matched)
         if start_btn:
-            log.info("  [nav] Clicking 'Start New Booking'…")
-            try:
-                driver.execute_script("arguments[0].click();", start_btn)
-            except Exception:
-                pass
-            time.sleep(PAGE_NAV_WAIT)
+            log.info("  [nav] Clicked 'Start New Booking'.")
         else:
-            log.warning("  [nav] 'Start New Booking' not found — navigating directly.")
+            log.warning("  [nav] 'Start New Booking' not clickable — navigating directly.")
             driver.get(VFS_BOOKING_URL)
             _wait_cf(driver)
-            time.sleep(PAGE_NAV_WAIT)
+
+        # Wait for the form's first control rather than a fixed pause;
+        # step 1 keeps waiting (up to ELEMENT_WAIT) if it is slower than this.
+        _wait(driver, SEL["app_centre"], timeout=PAGE_NAV_WAIT)
 
         log.info("  [nav] Booking URL: %s", _current_url(driver))
 
@@ -856,42 +1449,102 @@ def book_client(client: dict, idx: int, total: int,
             result["status"] = "SUBMITTED"
             log.info("[Client %d] ✓  Form submitted — no reference text found. Check browser.", idx)
 
-        # Keep the window open briefly so the user can verify
-        time.sleep(5)
-
     except Exception as exc:
         log.exception("[Client %d] Unhandled error: %s", idx, exc)
         result["error"] = str(exc)
     finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        if own_driver and driver:
+            quit_slot_driver(driver, slot)
 
     return result
 
 
+def book_client_pooled(pool: BrowserPool, client: dict, idx: int, total: int,
+                       headless: bool = False, proxy: str = "") -> dict:
+    """book_client on a window borrowed from `pool` instead of a fresh launch."""
+    with pool.driver(timeout=POOL_ACQUIRE_WAIT) as driver:
+        return book_client(client, idx, total, headless, proxy, driver=driver)
+
+
+# ─────────────────────────────────────────────────────────────
+# CLIENT LOADING
+# ─────────────────────────────────────────────────────────────
+
+def load_clients(path, limit: int) -> list[dict]:
+    """Read up to `limit` rows of the clients CSV as plain string dicts
+    (stdlib csv — no pandas import on the start-up path)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        return [{k: (v or "") for k, v in row.items() if k is not None}
+                for _, row in zip(range(limit), reader)]
+
+
 # ─────────────────────────────────────────────────────────────
 # RESULTS WRITER
 # ─────────────────────────────────────────────────────────────
 
-def save_results(results: list[dict]) -> None:
-    RESULTS_CSV.parent.mkdir(parents=True, exist_ok=True)
-    fields = ["name", "email", "status", "reference", "error", "timestamp"]
-    write_header = not RESULTS_CSV.exists()
-    with open(RESULTS_CSV, "a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        if write_header:
-            w.writeheader()
-        w.writerows(results)
-    log.info("[Results] Written to %s", RESULTS_CSV)
+class ResultsWriter:
+    """
+    Append-only results CSV, opened once per run.  Each client's row is
+    written and flushed as it finishes (append() is thread-safe), so a crash
+    mid-run keeps every result so far; close() fsyncs once at the end.
+    """
+
+    FIELDS = ["name", "email", "status", "reference", "error", "timestamp"]
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._f = open(path, "a", newline="", encoding="utf-8", buffering=8192)
+        self._w = csv.DictWriter(self._f, fieldnames=self.FIELDS)
+        self._lock = threading.Lock()
+        if self._f.tell() == 0:
+            self._w.writeheader()
+
+    def append(self, result: dict) -> None:
+        with self._lock:
+            self._w.writerow(result)
+            self._f.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._f.close()
+        log.info("[Results] Written to %s", self.path)
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 # ─────────────────────────────────────────────────────────────
 # MAIN
 # ─────────────────────────────────────────────────────────────
 
+def _prewarm_connection(proxy: str = "") -> None:
+    """Hit the VFS host once from Python while the CSV loads and Chrome starts,
+    so DNS (and the proxy connection) are warm for the first navigation.
+    Any response, even a 403, does the job; failures are ignored."""
+    if requests is None:
+        return
+    proxies = {"http": proxy, "https": proxy} if proxy else None
+    try:
+        requests.get(VFS_LOGIN_URL, timeout=10, proxies=proxies)
+    except Exception:
+        pass
+
+
+def _max_windows(wanted: int) -> int:
+    """Cap parallel Chrome windows by available RAM (uncapped without psutil)."""
+    if psutil is None:
+        return wanted
+    fit = int(psutil.virtual_memory().available // CHROME_RAM_BYTES)
+    return min(wanted, max(1, fit))
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(
         description="VFS Global Guinea-Bissau → Portugal unified booking bot"
@@ -910,13 +1563,15 @@ def main() -> None:
                     help="Path to clients CSV (default: %(default)s).")
     args = ap.parse_args()
 
+    threading.Thread(target=_prewarm_connection, args=(args.proxy,),
+                     name="prewarm", daemon=True).start()
+
     # Ensure log dirs exist
     (Path(__file__).parent / "logs").mkdir(exist_ok=True)
     SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Load clients
-    df = pd.read_csv(args.csv, dtype=str).fillna("")
-    clients = df.to_dict(orient="records")[: args.max_clients]
+    clients = load_clients(args.csv, args.max_clients)
     log.info("[Main] Loaded %d client(s) from %s", len(clients), args.csv)
 
     if not args.proxy:
@@ -934,8 +1589,9 @@ def main() -> None:
         log.info("  3. Navigate to 'Start New Booking' so CF cookies warm up.")
         log.info("  4. Come back here and press ENTER.")
         log.info("="*60)
-        profile = os.path.join(CHROME_PROFILE, "warmup")
-        driver = launch_driver(headless=False, proxy=args.proxy, profile_dir=profile)
+        driver, slot = launch_slot_driver(1, proxy=args.proxy)
+        if driver is None:
+            sys.exit(1)
         driver.get(VFS_LOGIN_URL)
         _wait_cf(driver)
         try:
@@ -950,54 +1606,74 @@ def main() -> None:
             log.info("[Warmup] ✓ Booking form loaded — session warmed.")
         else:
             log.warning("[Warmup] ✗ Booking form did NOT load. Stuck at: %s", _current_url(driver))
+        _cache_cf_cookies(driver)
         time.sleep(3)
-        driver.quit()
-        log.info("[Warmup] Profile saved to: %s", CHROME_PROFILE)
+        quit_slot_driver(driver, slot)
+        _save_cf_cookies()
+
+        # The other slots reuse slot 1's CF cookies and log in once each
+        if len(clients) > 1:
+            log.info("[Warmup] Seeding profile slots 2-%d…", len(clients))
+            with ThreadPoolExecutor(max_workers=len(clients) - 1) as pool:
+                list(pool.map(lambda i: warm_slot(i, args.proxy),
+                              range(2, len(clients) + 1)))
+        log.info("[Warmup] Profiles saved to: %s", CHROME_PROFILE)
         log.info("[Warmup] Run without --warmup when the booking window opens.")
         return
 
     # ── BOOKING MODE ─────────────────────────────────────────
+    if not clients:
+        log.warning("[Main] No clients to book in %s — nothing to do.", args.csv)
+        return
     log.info("\n[Main] Starting %d booking(s)  [mode: %s]…",
              len(clients), "sequential" if args.sequential else "parallel")
-    t0 = time.monotonic()
-    results = []
-
-    if args.sequential:
-        for i, client in enumerate(clients, start=1):
-            r = book_client(client, i, len(clients),
-                            headless=args.headless, proxy=args.proxy)
-            results.append(r)
-    else:
-        # Each client gets its own thread and its own Chrome window
-        with ThreadPoolExecutor(max_workers=len(clients)) as pool:
-            futures = {
-                pool.submit(book_client, client, i, len(clients),
-                            args.headless, args.proxy): i
-                for i, client in enumerate(clients, start=1)
-            }
-            for future in as_completed(futures):
-                try:
-                    results.append(future.result())
-                except Exception as exc:
+    t0 = time.perf_counter()
+    results: dict[int, dict] = {}   # client index -> result
+
+    with ResultsWriter(RESULTS_CSV) as writer:
+        # Each worker thread drives one pooled Chrome window; with fewer
+        # windows than clients, a window is reused once its client is done
+        # (sequential mode is simply a pool of one).  The pool warms all
+        # windows in parallel, and each worker starts as soon as any window
+        # is ready rather than after the slowest.
+        workers = 1 if args.sequential else _max_windows(len(clients))
+        if workers < len(clients) and not args.sequential:
+            log.info("[Main] Free RAM fits %d window(s) — the other clients queue.", workers)
+        browsers = BrowserPool(workers, args.headless, args.proxy).start()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(book_client_pooled, browsers, client, i, len(clients),
+                                args.headless, args.proxy): i
+                    for i, client in enumerate(clients, start=1)
+                }
+                for future in as_completed(futures):
                     idx = futures[future]
-                    log.error("[Client %d] Thread raised: %s", idx, exc)
-                    results.append({
-                        "name": f"Client {idx}", "email": "", "status": "FAILED",
-                        "reference": "", "error": str(exc),
-                        "timestamp": datetime.now().isoformat(timespec="seconds"),
-                    })
-
-    elapsed = time.monotonic() - t0
+                    try:
+                        r = future.result()
+                    except Exception as exc:
+                        log.error("[Client %d] Thread raised: %s", idx, exc)
+                        r = {
+                            "name": f"Client {idx}", "email": "", "status": "FAILED",
+                            "reference": "", "error": str(exc),
+                            "timestamp": _timestamp(),
+                        }
+                    results[idx] = r
+                    writer.append(r)
+        finally:
+            browsers.close()
+
+    elapsed = time.perf_counter() - t0
     log.info("\n[Main] All %d client(s) done in %.1fs.", len(clients), elapsed)
 
     # ── Summary ──────────────────────────────────────────────
-    log.info("\n%s  RESULTS  %s", "─"*25, "─"*25)
-    for r in results:
-        log.info("  %-30s  %-10s  %s", r["name"], r["status"],
-                 r.get("reference", r.get("error", "")))
-    log.info("─"*61)
+    # One record for the whole table so it can't interleave with worker logs,
+    # in CSV order rather than the order clients happened to finish
+    rows = [f"  {r['name']:<30}  {r['status']:<10}  {r.get('reference') or r.get('error', '')}"
+            for _, r in sorted(results.items())]
+    log.info("\n".join(["", f"{'─'*25}  RESULTS  {'─'*25}", *rows, "─"*61]))
 
-    save_results(results)
+    _save_cf_cookies()
 
 
 if __name__ == "__main__":